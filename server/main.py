@@ -1,5 +1,7 @@
 """MCP server for providing regulatory context to LLMs."""
 
+import asyncio
+import functools
 import os
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
@@ -15,6 +17,12 @@ from .region_store import RegionStore
 from .regulation_store import RegulationStore
 
 
+@functools.cache
+def _load_env() -> None:
+    """Load the .env file into the environment, parsing it once per process."""
+    load_dotenv()
+
+
 def get_regulation_data_dir() -> str:
     """
     Get the regulation data directory from environment variable.
@@ -26,7 +34,7 @@ def get_regulation_data_dir() -> str:
         ValueError: If REGULATION_DATA_DIR is not set
     """
     # Load .env file if it exists
-    load_dotenv()
+    _load_env()
     
     data_dir = os.getenv("REGULATION_DATA_DIR")
     if not data_dir:
@@ -39,10 +47,6 @@ def get_regulation_data_dir() -> str:
     return data_dir
 
 
-# Get data directory from environment variable
-DATA_DIR = get_regulation_data_dir()
-
-
 @dataclass
 class AppContext:
     """Application context with typed dependencies."""
@@ -57,11 +61,14 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
     Manage application lifecycle with type-safe context.
     
     Initializes RegulationStore and RegionStore on startup,
-    and ensures proper cleanup on shutdown.
+    and ensures proper cleanup on shutdown. The data directory is read
+    from the environment here rather than at import time, so each server
+    instance picks up the current REGULATION_DATA_DIR.
     """
     # Initialize stores on startup
-    regulation_store = RegulationStore(DATA_DIR)
-    region_store = RegionStore(DATA_DIR, regulation_store)
+    data_dir = get_regulation_data_dir()
+    regulation_store = RegulationStore(data_dir)
+    region_store = RegionStore(data_dir, regulation_store)
     
     try:
         yield AppContext(
@@ -78,7 +85,7 @@ mcp = FastMCP("Regulatory Context Server", lifespan=app_lifespan)
 
 
 @mcp.tool()
-def get_regulation(
+async def get_regulation(
     regulation_id: str,
     ctx: Context[ServerSession, AppContext]
 ) -> dict[str, Any]:
@@ -120,7 +127,7 @@ def get_regulation(
 
 
 @mcp.tool()
-def get_region(
+async def get_region(
     region_id: str,
     ctx: Context[ServerSession, AppContext]
 ) -> dict[str, Any]:
@@ -150,7 +157,9 @@ def get_region(
         }
     """
     app_ctx = ctx.request_context.lifespan_context
-    region = app_ctx.region_store.get_region(
+    # May read a fallback regulation file, so keep it off the event loop
+    region = await asyncio.to_thread(
+        app_ctx.region_store.get_region,
         region_id,
         app_ctx.regulation_store
     )
@@ -165,7 +174,7 @@ def get_region(
 
 
 @mcp.tool()
-def search_regulations(
+async def search_regulations(
     keywords: str,
     ctx: Context[ServerSession, AppContext]
 ) -> list[dict[str, Any]]:
@@ -207,7 +216,11 @@ def search_regulations(
         ]
     """
     app_ctx = ctx.request_context.lifespan_context
-    results = app_ctx.regulation_store.search_regulations(keywords)
+    # Searching is CPU-bound, so run it in a worker thread
+    results = await asyncio.to_thread(
+        app_ctx.regulation_store.search_regulations,
+        keywords
+    )
     
     if not results:
         return [
@@ -26,7 +26,15 @@ class RegionStore:
         self.data_dir = Path(data_dir)
         self.regulation_store = regulation_store
         self.regions: dict[str, dict[str, Any]] = {}
+        self._fallback_paths: dict[str, dict[str, Path]] = {}
+        self._region_cache: dict[str, dict[str, Any]] = {}
         self._load_regions()
+        self._load_fallback_paths()
+        # Results for lookups without a regulation store, built once
+        self._empty_regions: dict[str, dict[str, Any]] = {
+            region_id: dict(region, regulations=[])
+            for region_id, region in self.regions.items()
+        }
     
     def _load_regions(self) -> None:
         """Load regions.json from the data directory."""
@@ -55,6 +63,25 @@ class RegionStore:
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in regions.json: {e}")
     
+    def _load_fallback_paths(self) -> None:
+        """
+        Map each region's subdirectory files by normalized regulation ID.
+        
+        get_region falls back to <data_dir>/<region_id>/<reg_id>.json when a
+        regulation is missing from the RegulationStore. Scanning those
+        directories once here turns the fallback into a dict lookup instead
+        of a filesystem probe on every request. File names are matched
+        case-insensitively. The map is a snapshot taken at startup, so files
+        added later are only picked up after a restart.
+        """
+        for region_id in self.regions:
+            region_dir = self.data_dir / region_id
+            if region_dir.is_dir():
+                self._fallback_paths[region_id] = {
+                    normalize_string(reg_path.stem): reg_path
+                    for reg_path in region_dir.glob("*.json")
+                }
+    
     def get_region(
         self, 
         region_id: str, 
@@ -63,6 +90,11 @@ class RegionStore:
         """
         Get a region by its ID with aggregated regulations.
         
+        Results built with the instance's own regulation store are cached,
+        since region data does not change after loading, and results without
+        a store are prebuilt at load time. Callers receive these shared
+        dictionaries and must not modify them.
+        
         Args:
             region_id: The region ID to look up
             regulation_store: RegulationStore instance to load regulations.
@@ -71,7 +103,11 @@ class RegionStore:
         Returns:
             Region dictionary with regulations list populated, or None if not found
         """
-        normalized_id = normalize_string(region_id)
+        # Keys are already normalized, so an exact hit needs no normalization
+        if region_id in self.regions:
+            normalized_id = region_id
+        else:
+            normalized_id = normalize_string(region_id)
         region = self.regions.get(normalized_id)
         
         if region is None:
@@ -82,7 +118,13 @@ class RegionStore:
         
         if store is None:
             # If no store available, return region without regulations
-            return {**region, "regulations": []}
+            return self._empty_regions[normalized_id]
+        
+        use_cache = store is self.regulation_store
+        if use_cache:
+            cached = self._region_cache.get(normalized_id)
+            if cached is not None:
+                return cached
         
         # Aggregate regulations for this region
         regulation_ids = region.get("regulations", [])
@@ -94,8 +136,10 @@ class RegionStore:
                 regulations.append(regulation)
             else:
                 # Regulation file might be in region subdirectory
-                reg_path = self.data_dir / normalized_id / f"{reg_id}.json"
-                if reg_path.exists():
+                reg_path = self._fallback_paths.get(normalized_id, {}).get(
+                    normalize_string(reg_id)
+                )
+                if reg_path is not None:
                     try:
                         regulation = load_json_file(reg_path)
                         regulations.append(regulation)
@@ -104,8 +148,9 @@ class RegionStore:
                         continue
         
         # Return region with populated regulations
-        return {
-            **region,
-            "regulations": regulations
-        }
+        result = dict(region, regulations=regulations)
+        if use_cache:
+            result = self._region_cache.setdefault(normalized_id, result)
+        
+        return result
 
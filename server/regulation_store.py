@@ -1,12 +1,124 @@
 """RegulationStore class for loading and managing regulation data."""
 
-import json
+import bisect
 import os
+import re
+import sys
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from .utils import load_json_file, normalize_string
 
+# Single-file bundle of all regulations, written by write_regulation_bundle
+BUNDLE_FILENAME = "regulations.bundle.json"
+
+# JSON files in the data directory that are not regulations
+_NON_REGULATION_FILES = frozenset({"regions.json", BUNDLE_FILENAME})
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+# Separates fields in a regulation's search haystack
+_FIELD_SEPARATOR = "\x1f"
+
+# Separates terms in the joined index vocabulary (never part of a token)
+_TERM_SEPARATOR = "\n"
+
+# Ranking of search results by primary match type (lower ranks first)
+_MATCH_RANKS = {
+    "name": 0,
+    "summary": 1,
+    "article_title": 2,
+    "article_summary": 2,
+    "developer_guidance": 3,
+}
+
+# Upper bound on threads used to read regulation files concurrently
+_MAX_LOAD_WORKERS = 32
+
+
+def _iter_regulation_files(directory: str | Path) -> Iterator[str]:
+    """
+    Recursively yield the paths of regulation JSON files under a directory.
+    
+    Uses os.scandir so file type checks come from the directory listing
+    instead of a separate stat call per entry. regions.json and the
+    regulation bundle are skipped.
+    
+    Args:
+        directory: Directory to scan
+        
+    Yields:
+        Path of each regulation JSON file
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_regulation_files(entry.path)
+            elif entry.name.endswith(".json") and entry.name not in _NON_REGULATION_FILES:
+                yield entry.path
+
+
+def _file_manifest(data_dir: str | Path, paths: list[str]) -> dict[str, list[int]]:
+    """
+    Record the modification time and size of each regulation file.
+    
+    Args:
+        data_dir: Directory the paths are relative to
+        paths: Regulation file paths under data_dir
+        
+    Returns:
+        Mapping of each path, relative to data_dir with "/" separators,
+        to [st_mtime_ns, st_size]
+    """
+    manifest = {}
+    for file_path in paths:
+        stat = os.stat(file_path)
+        relative_path = os.path.relpath(file_path, data_dir).replace(os.sep, "/")
+        manifest[relative_path] = [stat.st_mtime_ns, stat.st_size]
+    return manifest
+
+
+def write_regulation_bundle(data_dir: str | Path) -> Path:
+    """
+    Pack every regulation file under a data directory into one bundle file.
+    
+    RegulationStore loads the bundle with a single read instead of scanning
+    and parsing each regulation file. The bundle also records the size and
+    modification time of every file it was built from; RegulationStore
+    ignores it once any regulation file is added, removed or changed.
+    Invalid files are skipped, as RegulationStore does when scanning.
+    
+    Args:
+        data_dir: Path to the regulation data directory
+        
+    Returns:
+        Path of the written bundle file
+    """
+    data_dir = Path(data_dir)
+    paths = list(_iter_regulation_files(data_dir))
+    # Stat before reading so an edit made during the build marks the bundle stale
+    files = _file_manifest(data_dir, paths)
+    regulations: dict[str, dict[str, Any]] = {}
+    
+    for file_path in paths:
+        try:
+            data = load_json_file(file_path)
+            if "id" in data:
+                regulations[normalize_string(data["id"])] = data
+        except (orjson.JSONDecodeError, KeyError) as e:
+            # Skip invalid files but continue bundling others
+            print(f"Warning: Skipping invalid regulation file {file_path}: {e}", file=sys.stderr)
+            continue
+    
+    bundle_path = data_dir / BUNDLE_FILENAME
+    bundle_path.write_bytes(orjson.dumps({"files": files, "regulations": regulations}))
+    return bundle_path
+
 
 class RegulationStore:
     """Stores and manages regulation data loaded from JSON files."""
@@ -20,6 +132,16 @@ class RegulationStore:
         """
         self.data_dir = Path(data_dir)
         self.regulations: dict[str, dict[str, Any]] = {}
+        self._index: dict[str, set[str]] = {}
+        # reg_id -> (haystack, field end offsets, (match_type, item index) per field)
+        self._haystacks: dict[str, tuple[str, list[int], list[tuple[str, int]]]] = {}
+        self._positions: dict[str, int] = {}
+        # Index terms joined into one string, with the end offset of each term
+        self._vocabulary = ""
+        self._vocabulary_terms: list[str] = []
+        self._vocabulary_ends: list[int] = []
+        self._search_index_ready = False
+        self._search_index_lock = threading.Lock()
         self._load_regulations()
     
     def _load_regulations(self) -> None:
@@ -30,32 +152,324 @@ class RegulationStore:
                 "Please ensure the directory exists and contains regulation JSON files."
             )
         
-        # Walk through all subdirectories to find regulation JSON files
-        for root, dirs, files in os.walk(self.data_dir):
-            # Skip the root directory itself if it contains regions.json
-            for file in files:
-                if file.endswith(".json") and file != "regions.json":
-                    file_path = Path(root) / file
-                    try:
-                        data = load_json_file(file_path)
-                        if "id" in data:
-                            reg_id = normalize_string(data["id"])
-                            self.regulations[reg_id] = data
-                    except (json.JSONDecodeError, KeyError) as e:
-                        # Skip invalid files but continue loading others
-                        print(f"Warning: Skipping invalid regulation file {file_path}: {e}")
-                        continue
+        # Scan all subdirectories for regulation JSON files
+        paths = list(_iter_regulation_files(self.data_dir))
+        
+        # Prefer the prebuilt bundle: one read instead of one per regulation
+        bundle_path = self.data_dir / BUNDLE_FILENAME
+        if bundle_path.is_file() and self._load_bundle(bundle_path, paths):
+            return
+        
+        if not paths:
+            return
+        
+        # Read and parse files concurrently so slow storage doesn't serialize startup
+        with ThreadPoolExecutor(max_workers=min(_MAX_LOAD_WORKERS, len(paths))) as executor:
+            futures = [executor.submit(load_json_file, file_path) for file_path in paths]
+        
+        for file_path, future in zip(paths, futures):
+            try:
+                data = future.result()
+                if "id" in data:
+                    reg_id = normalize_string(data["id"])
+                    self.regulations[reg_id] = data
+            except (orjson.JSONDecodeError, KeyError) as e:
+                # Skip invalid files but continue loading others
+                print(f"Warning: Skipping invalid regulation file {file_path}: {e}", file=sys.stderr)
+                continue
+    
+    def _bundle_is_current(
+        self, bundle_path: Path, files: dict[str, Any], paths: list[str]
+    ) -> bool:
+        """
+        Check that no regulation file changed since the bundle was written.
+        
+        Compares the file manifest recorded in the bundle with the size and
+        modification time of each regulation file found by the directory scan.
+        
+        Args:
+            bundle_path: Path to the bundle file
+            files: File manifest recorded in the bundle
+            paths: Regulation file paths found by the directory scan
+            
+        Returns:
+            True if the regulation files match the manifest exactly
+        """
+        current = _file_manifest(self.data_dir, paths)
+        if current == files:
+            return True
+        
+        changed = sorted(
+            path for path in current.keys() | files.keys()
+            if current.get(path) != files.get(path)
+        )
+        shown = ", ".join(changed[:5]) + (", ..." if len(changed) > 5 else "")
+        print(
+            f"Warning: Ignoring stale regulation bundle {bundle_path}; "
+            f"{len(changed)} regulation file(s) changed since it was written: {shown}",
+            file=sys.stderr,
+        )
+        return False
+    
+    def _load_bundle(self, bundle_path: Path, paths: list[str]) -> bool:
+        """
+        Load all regulations from a bundle written by write_regulation_bundle.
+        
+        Args:
+            bundle_path: Path to the bundle file
+            paths: Regulation file paths found by the directory scan
+            
+        Returns:
+            True if the bundle was loaded, False if it is invalid or stale
+        """
+        # Fall back to loading the individual regulation files when invalid
+        try:
+            bundle = load_json_file(bundle_path)
+        except orjson.JSONDecodeError as e:
+            print(f"Warning: Ignoring invalid regulation bundle {bundle_path}: {e}", file=sys.stderr)
+            return False
+        
+        is_valid = (
+            isinstance(bundle, dict)
+            and isinstance(bundle.get("files"), dict)
+            and isinstance(bundle.get("regulations"), dict)
+            and all(
+                isinstance(data, dict) and "id" in data
+                for data in bundle["regulations"].values()
+            )
+        )
+        if not is_valid:
+            print(
+                f"Warning: Ignoring invalid regulation bundle {bundle_path}: "
+                "expected \"files\" and \"regulations\" objects; rebuild it with "
+                "write_regulation_bundle",
+                file=sys.stderr,
+            )
+            return False
+        
+        if not self._bundle_is_current(bundle_path, bundle["files"], paths):
+            return False
+        
+        for reg_id, data in bundle["regulations"].items():
+            self.regulations[normalize_string(reg_id)] = data
+        return True
+    
+    def _ensure_search_index(self) -> None:
+        """
+        Build the search index on first use.
+        
+        Deferring the build keeps startup to file loading only; sessions that
+        never search don't pay for tokenizing every article.
+        """
+        if self._search_index_ready:
+            return
+        
+        with self._search_index_lock:
+            if not self._search_index_ready:
+                self._build_search_index()
+                self._search_index_ready = True
+    
+    def _build_search_index(self) -> None:
+        """
+        Build the search index and normalized text cache for all regulations.
+        
+        Searchable fields (name, summary, article titles and summaries,
+        developer guidance) never change after loading, so they are normalized
+        once here and joined into a single haystack per regulation, with a
+        table of where each field ends. Their tokens feed an inverted index,
+        so a query only has to be checked against regulations that contain
+        all of its tokens.
+        """
+        _lower = str.lower
+        for position, (reg_id, reg) in enumerate(self.regulations.items()):
+            self._positions[reg_id] = position
+            
+            # Fields in the order matches are reported
+            texts = [reg.get("name", ""), reg.get("summary", "")]
+            fields = [("name", 0), ("summary", 0)]
+            for i, article in enumerate(reg.get("articles", [])):
+                texts.append(article.get("title", ""))
+                texts.append(article.get("summary", ""))
+                fields.append(("article_title", i))
+                fields.append(("article_summary", i))
+            for i, guidance in enumerate(reg.get("developer_guidance", [])):
+                texts.append(guidance)
+                fields.append(("developer_guidance", i))
+            
+            # Lowercase only: keeps offsets aligned with the original text
+            normalized_texts = [_lower(text) for text in texts]
+            ends: list[int] = []
+            offset = 0
+            for text in normalized_texts:
+                offset += len(text)
+                ends.append(offset)
+                offset += len(_FIELD_SEPARATOR)
+            
+            haystack = _FIELD_SEPARATOR.join(normalized_texts)
+            self._haystacks[reg_id] = (haystack, ends, fields)
+            
+            for token in _TOKEN_PATTERN.findall(haystack):
+                self._index.setdefault(token, set()).add(reg_id)
+        
+        self._vocabulary_terms = list(self._index)
+        self._vocabulary = _TERM_SEPARATOR.join(self._vocabulary_terms)
+        offset = 0
+        for term in self._vocabulary_terms:
+            offset += len(term)
+            self._vocabulary_ends.append(offset)
+            offset += len(_TERM_SEPARATOR)
+    
+    def _terms_containing(self, token: str) -> list[str]:
+        """
+        Find every index term that contains a query token.
+        
+        Scans the joined vocabulary with str.find rather than testing each
+        term in a Python loop, so the cost scales with the number of matching
+        terms instead of the vocabulary size.
+        
+        Args:
+            token: A normalized query token
+            
+        Returns:
+            Index terms containing the token
+        """
+        terms: list[str] = []
+        idx = self._vocabulary.find(token)
+        while idx != -1:
+            term_pos = bisect.bisect_right(self._vocabulary_ends, idx)
+            terms.append(self._vocabulary_terms[term_pos])
+            # Continue from the next term
+            idx = self._vocabulary.find(
+                token, self._vocabulary_ends[term_pos] + len(_TERM_SEPARATOR)
+            )
+        
+        return terms
+    
+    def _candidate_ids(self, normalized_keywords: str) -> list[str]:
+        """
+        Get the IDs of regulations that may contain the given keywords.
+        
+        Keywords match as substrings, so each query token may sit inside a
+        longer indexed token (e.g. "encrypt" inside "encryption"). Every
+        query token must appear in a regulation for it to be a candidate.
+        
+        Args:
+            normalized_keywords: Normalized search keywords
+            
+        Returns:
+            Candidate regulation IDs in load order
+        """
+        tokens = set(_TOKEN_PATTERN.findall(normalized_keywords))
+        if not tokens:
+            # Nothing to look up (e.g. punctuation only), check everything
+            return list(self.regulations)
+        
+        candidates: set[str] | None = None
+        for token in tokens:
+            matching: set[str] = set()
+            for term in self._terms_containing(token):
+                matching |= self._index[term]
+            candidates = matching if candidates is None else candidates & matching
+            if not candidates:
+                return []
+        
+        return sorted(candidates, key=self._positions.__getitem__)
+    
+    def _find_matches(
+        self, reg_id: str, normalized_keywords: str
+    ) -> list[tuple[str, int, int]]:
+        """
+        Find every searchable field of a regulation that contains the keywords.
+        
+        Scans the regulation's haystack with str.find and maps each hit back
+        to its field through the end offset table. Each field counts once,
+        at its first hit.
+        
+        Args:
+            reg_id: Normalized regulation ID
+            normalized_keywords: Normalized search keywords
+            
+        Returns:
+            (match_type, item index, match offset within the field) for each
+            matching field, in field order
+        """
+        haystack, ends, fields = self._haystacks[reg_id]
+        if not normalized_keywords:
+            # The empty string is contained in every field
+            return [(match_type, item, 0) for match_type, item in fields]
+        
+        found: list[tuple[str, int, int]] = []
+        keywords_len = len(normalized_keywords)
+        idx = haystack.find(normalized_keywords)
+        while idx != -1:
+            field_pos = bisect.bisect_right(ends, idx)
+            field_end = ends[field_pos]
+            if idx + keywords_len <= field_end:
+                field_start = ends[field_pos - 1] + len(_FIELD_SEPARATOR) if field_pos else 0
+                match_type, item = fields[field_pos]
+                found.append((match_type, item, idx - field_start))
+                # Continue from the next field
+                idx = haystack.find(normalized_keywords, field_end + len(_FIELD_SEPARATOR))
+            else:
+                # Hit crosses a field boundary, keep looking in this field
+                idx = haystack.find(normalized_keywords, idx + 1)
+        
+        return found
+    
+    def _match_snippet(
+        self,
+        reg: dict[str, Any],
+        match_type: str,
+        item: int,
+        match_start: int,
+        match_len: int
+    ) -> str:
+        """
+        Build the snippet shown for a matching field.
+        
+        Args:
+            reg: The regulation dictionary
+            match_type: Type of the matching field
+            item: Index of the article or guidance item that matched
+            match_start: Offset of the match within the field text
+            match_len: Length of the matched keywords
+            
+        Returns:
+            Snippet text for the field
+        """
+        if match_type == "name":
+            return reg.get("name", "")
+        if match_type == "summary":
+            return self._extract_snippet(reg.get("summary", ""), match_start, match_len)
+        if match_type == "developer_guidance":
+            return reg["developer_guidance"][item]
+        
+        article = reg["articles"][item]
+        if match_type == "article_title":
+            text = article.get("title", "")
+        else:
+            text = self._extract_snippet(article.get("summary", ""), match_start, match_len)
+        return f"Article {article.get('article', 'N/A')}: {text}"
     
     def get_regulation(self, regulation_id: str) -> dict[str, Any] | None:
         """
         Get a regulation by its ID (case-insensitive).
         
+        The stored dictionary is returned rather than a copy, so every lookup
+        of the same regulation returns the same object. Callers must not
+        modify it.
+        
         Args:
             regulation_id: The regulation ID to look up
             
         Returns:
             The full regulation dictionary, or None if not found
         """
+        # Keys are already normalized, so an exact hit needs no normalization
+        regulation = self.regulations.get(regulation_id)
+        if regulation is not None:
+            return regulation
+        
         normalized_id = normalize_string(regulation_id)
         return self.regulations.get(normalized_id)
     
@@ -82,52 +496,34 @@ class RegulationStore:
             - snippet: Text snippet showing why it matched
             - match_type: Type of match (name, summary, article, guidance)
         """
+        self._ensure_search_index()
+        
         normalized_keywords = normalize_string(keywords)
-        results: list[dict[str, Any]] = []
+        # Results bucketed by rank: name, summary, article, then guidance matches
+        ranked_results: list[list[dict[str, Any]]] = [[], [], [], []]
         seen_ids: set[str] = set()
         
-        for reg_id, reg in self.regulations.items():
+        for reg_id in self._candidate_ids(normalized_keywords):
             if reg_id in seen_ids:
                 continue
             
-            matches: list[tuple[str, str]] = []  # (match_type, snippet)
-            
-            # Search in name
-            name = reg.get("name", "")
-            if normalized_keywords in normalize_string(name):
-                matches.append(("name", name))
-            
-            # Search in summary
-            summary = reg.get("summary", "")
-            if normalized_keywords in normalize_string(summary):
-                # Extract a snippet around the match
-                snippet = self._extract_snippet(summary, normalized_keywords)
-                matches.append(("summary", snippet))
-            
-            # Search in articles
-            for article in reg.get("articles", []):
-                title = article.get("title", "")
-                article_summary = article.get("summary", "")
-                
-                if normalized_keywords in normalize_string(title):
-                    matches.append(("article_title", f"Article {article.get('article', 'N/A')}: {title}"))
-                
-                if normalized_keywords in normalize_string(article_summary):
-                    snippet = self._extract_snippet(article_summary, normalized_keywords)
-                    matches.append(("article_summary", f"Article {article.get('article', 'N/A')}: {snippet}"))
-            
-            # Search in developer_guidance
-            for guidance in reg.get("developer_guidance", []):
-                if normalized_keywords in normalize_string(guidance):
-                    matches.append(("developer_guidance", guidance))
+            matches = self._find_matches(reg_id, normalized_keywords)
             
             # If we found matches, add to results
             if matches:
                 seen_ids.add(reg_id)
+                reg = self.regulations[reg_id]
                 # Use the first match as the primary snippet
-                primary_match_type, primary_snippet = matches[0]
+                primary_match_type, primary_item, primary_start = matches[0]
+                primary_snippet = self._match_snippet(
+                    reg,
+                    primary_match_type,
+                    primary_item,
+                    primary_start,
+                    len(normalized_keywords)
+                )
                 
-                results.append({
+                ranked_results[_MATCH_RANKS[primary_match_type]].append({
                     "id": reg_id,
                     "name": reg.get("name", ""),
                     "snippet": primary_snippet,
@@ -135,42 +531,32 @@ class RegulationStore:
                     "all_matches": len(matches),  # Count of total matches
                 })
         
-        # Simple ranking: prioritize name matches, then summary, then others
-        def rank_key(result: dict[str, Any]) -> int:
-            match_type = result.get("match_type", "")
-            if match_type == "name":
-                return 0
-            elif match_type == "summary":
-                return 1
-            elif match_type.startswith("article"):
-                return 2
-            else:
-                return 3
-        
-        results.sort(key=rank_key)
-        return results
+        return [result for bucket in ranked_results for result in bucket]
     
-    def _extract_snippet(self, text: str, keywords: str, context_chars: int = 100) -> str:
+    def _extract_snippet(
+        self,
+        text: str,
+        match_start: int,
+        match_len: int,
+        context_chars: int = 100
+    ) -> str:
         """
-        Extract a snippet of text around matching keywords.
+        Extract a snippet of text around a known match.
+        
+        The match offset comes from the search haystack, so the text is
+        sliced once without being lowercased or searched again.
         
         Args:
-            text: The full text to search
-            keywords: The keywords to find
+            text: The original field text
+            match_start: Offset of the match within the text
+            match_len: Length of the match
             context_chars: Number of characters to include before/after match
             
         Returns:
             Snippet with context around the match
         """
-        text_lower = normalize_string(text)
-        keywords_lower = normalize_string(keywords)
-        
-        idx = text_lower.find(keywords_lower)
-        if idx == -1:
-            return text[:context_chars * 2] if len(text) > context_chars * 2 else text
-        
-        start = max(0, idx - context_chars)
-        end = min(len(text), idx + len(keywords) + context_chars)
+        start = max(0, match_start - context_chars)
+        end = min(len(text), match_start + match_len + context_chars)
         
         snippet = text[start:end]
         if start > 0:
@@ -1,9 +1,15 @@
 """Utility functions for the regulatory context server."""
 
-import json
+import mmap
+import os
 from pathlib import Path
 from typing import Any
 
+import orjson
+
+# Files at least this large are memory-mapped instead of copied into a bytes object
+MMAP_THRESHOLD = 256 * 1024
+
 
 def normalize_string(s: str) -> str:
     """
@@ -22,6 +28,9 @@ def load_json_file(file_path: str | Path) -> dict[str, Any]:
     """
     Safely load a JSON file with error handling.
     
+    Files of MMAP_THRESHOLD bytes or more are memory-mapped and parsed in
+    place rather than read into memory first.
+    
     Args:
         file_path: Path to the JSON file
         
@@ -30,12 +39,20 @@ def load_json_file(file_path: str | Path) -> dict[str, Any]:
         
     Raises:
         FileNotFoundError: If the file doesn't exist
-        json.JSONDecodeError: If the file contains invalid JSON
+        orjson.JSONDecodeError: If the file contains invalid JSON
+            (a subclass of json.JSONDecodeError)
     """
-    path = Path(file_path)
-    if not path.exists():
-        raise FileNotFoundError(f"JSON file not found: {file_path}")
+    # Work on the path as given; no Path object is needed to open it
+    try:
+        f = open(file_path, "rb")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"JSON file not found: {file_path}") from None
     
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
+    with f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            return orjson.loads(f.read())
+        
+        # Parse large files straight from the page cache to avoid a full copy
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
@@ -1,5 +1,6 @@
 """Setup script to create the regulation data directory and copy sample data."""
 
+import functools
 import os
 import shutil
 import sys
@@ -7,6 +8,17 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
+from server.regulation_store import BUNDLE_FILENAME, write_regulation_bundle
+
+# Region subdirectories copied from sample_data
+REGION_DIRS = ("eu", "usa", "brazil")
+
+
+@functools.cache
+def _load_env() -> None:
+    """Load the .env file into the environment, parsing it once per process."""
+    load_dotenv()
+
 
 def get_regulation_data_dir() -> Path:
     """
@@ -19,7 +31,7 @@ def get_regulation_data_dir() -> Path:
         SystemExit: If REGULATION_DATA_DIR is not set
     """
     # Load .env file if it exists
-    load_dotenv()
+    _load_env()
     
     data_dir = os.getenv("REGULATION_DATA_DIR")
     if not data_dir:
@@ -34,6 +46,46 @@ def get_regulation_data_dir() -> Path:
     return Path(data_dir)
 
 
+def _list_json_files(directory: Path) -> list[str]:
+    """
+    List the JSON file names in a directory, sorted.
+    
+    Args:
+        directory: Directory to list
+        
+    Returns:
+        Sorted JSON file names, or an empty list if the directory doesn't exist
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return sorted(
+                entry.name for entry in entries
+                if entry.is_file() and entry.name.endswith(".json")
+            )
+    except FileNotFoundError:
+        return []
+
+
+def _ignore_non_json(directory: str, names: list[str]) -> set[str]:
+    """
+    Tell shutil.copytree to skip everything but the JSON files in a directory.
+    
+    Editor backups, .DS_Store files, READMEs and subdirectories in sample_data
+    are not regulation data and stay out of the data directory.
+    
+    Args:
+        directory: Directory being copied
+        names: Entry names in that directory
+        
+    Returns:
+        Names to skip
+    """
+    return {
+        name for name in names
+        if not (name.endswith(".json") and os.path.isfile(os.path.join(directory, name)))
+    }
+
+
 def setup_regulation_data():
     """Create the regulation data directory and copy sample data."""
     # Target directory from environment variable
@@ -59,51 +111,40 @@ def setup_regulation_data():
     
     # Copy files
     try:
+        copied: list[str] = []
+        
         # Copy regions.json
         if (source_dir / "regions.json").exists():
             shutil.copy2(source_dir / "regions.json", target_dir / "regions.json")
-            print(f"Copied: regions.json")
-        
-        # Copy EU regulations
-        eu_source = source_dir / "eu"
-        eu_target = target_dir / "eu"
-        if eu_source.exists():
-            eu_target.mkdir(exist_ok=True)
-            for file in eu_source.glob("*.json"):
-                shutil.copy2(file, eu_target / file.name)
-                print(f"Copied: eu/{file.name}")
+            copied.append("regions.json")
         
-        # Copy USA regulations
-        usa_source = source_dir / "usa"
-        usa_target = target_dir / "usa"
-        if usa_source.exists():
-            usa_target.mkdir(exist_ok=True)
-            for file in usa_source.glob("*.json"):
-                shutil.copy2(file, usa_target / file.name)
-                print(f"Copied: usa/{file.name}")
+        # Copy each region's regulation files as a single tree copy
+        for region in REGION_DIRS:
+            region_source = source_dir / region
+            if region_source.exists():
+                shutil.copytree(
+                    region_source, target_dir / region,
+                    ignore=_ignore_non_json, dirs_exist_ok=True,
+                )
+                copied.append(f"{region}/")
         
-        # Copy Brazil regulations
-        brazil_source = source_dir / "brazil"
-        brazil_target = target_dir / "brazil"
-        if brazil_source.exists():
-            brazil_target.mkdir(exist_ok=True)
-            for file in brazil_source.glob("*.json"):
-                shutil.copy2(file, brazil_target / file.name)
-                print(f"Copied: brazil/{file.name}")
+        # Pack all regulations into a single file for faster server startup
+        write_regulation_bundle(target_dir)
         
-        print(f"\n✓ Successfully set up regulation data at: {target_dir}")
-        print("\nDirectory structure:")
-        print(f"  {target_dir}/")
-        print(f"    ├── regions.json")
-        print(f"    ├── eu/")
-        for file in sorted(eu_target.glob("*.json")) if eu_target.exists() else []:
-            print(f"    │   ├── {file.name}")
-        print(f"    ├── usa/")
-        for file in sorted(usa_target.glob("*.json")) if usa_target.exists() else []:
-            print(f"    │   ├── {file.name}")
-        print(f"    └── brazil/")
-        for file in sorted(brazil_target.glob("*.json")) if brazil_target.exists() else []:
-            print(f"        ├── {file.name}")
+        lines = [f"Copied: {name}" for name in copied]
+        lines.append(f"Created: {BUNDLE_FILENAME}")
+        lines.append(f"\n✓ Successfully set up regulation data at: {target_dir}")
+        lines.append("\nDirectory structure:")
+        lines.append(f"  {target_dir}/")
+        lines.append(f"    ├── regions.json")
+        lines.append(f"    ├── {BUNDLE_FILENAME}")
+        for i, region in enumerate(REGION_DIRS):
+            is_last = i == len(REGION_DIRS) - 1
+            lines.append(f"    {'└' if is_last else '├'}── {region}/")
+            prefix = "        " if is_last else "    │   "
+            for name in _list_json_files(target_dir / region):
+                lines.append(f"{prefix}├── {name}")
+        print("\n".join(lines))
         
     except Exception as e:
         print(f"Error copying files: {e}")
@@ -0,0 +1,105 @@
+"""Shared fixtures for the test suite."""
+
+import importlib.util
+import sys
+import tempfile
+from pathlib import Path
+
+import orjson
+import pytest
+
+REGIONS_DATA = [
+    {
+        "id": "eu",
+        "name": "European Union",
+        "regulations": ["gdpr"],
+        "notes": "EU regulations"
+    },
+    {
+        "id": "usa",
+        "name": "United States of America",
+        "regulations": ["hipaa"],
+        "notes": "US regulations"
+    }
+]
+
+GDPR_DATA = {
+    "id": "gdpr",
+    "name": "General Data Protection Regulation",
+    "region": "EU",
+    "risk_category": "high",
+    "summary": "GDPR is a data protection regulation in the EU",
+    "articles": [
+        {
+            "article": "32",
+            "title": "Security of Processing",
+            "summary": "Implement appropriate security measures for data processing",
+            "notes": "Security requirement"
+        }
+    ],
+    "developer_guidance": [
+        "Encrypt sensitive data at rest and in transit",
+        "Implement role-based access control"
+    ]
+}
+
+HIPAA_DATA = {
+    "id": "hipaa",
+    "name": "Health Insurance Portability and Accountability Act",
+    "region": "USA",
+    "risk_category": "high",
+    "summary": "HIPAA protects health information",
+    "articles": [
+        {
+            "article": "164.312",
+            "title": "Technical safeguards",
+            "summary": "Implement technical security measures",
+            "notes": "Technical requirements"
+        }
+    ],
+    "developer_guidance": [
+        "Encrypt PHI",
+        "Implement audit logging"
+    ]
+}
+
+# uvloop is optional; use it for async tests when it is installed
+_USE_UVLOOP = sys.platform != "win32" and importlib.util.find_spec("uvloop") is not None
+
+# Serialized once at import so the fixture only has to write bytes
+_REGIONS_JSON = orjson.dumps(REGIONS_DATA)
+_GDPR_JSON = orjson.dumps(GDPR_DATA)
+_HIPAA_JSON = orjson.dumps(HIPAA_DATA)
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    """Set anyio backend to asyncio (on uvloop if available) for the whole session."""
+    if _USE_UVLOOP:
+        return ("asyncio", {"use_uvloop": True})
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+def temp_data_dir():
+    """
+    Create a temporary directory with sample region and regulation data.
+    
+    The directory is created once per test session and shared by all tests,
+    so tests must treat it as read-only.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        data_dir = Path(tmpdir)
+        
+        # Create subdirectories
+        eu_dir = data_dir / "eu"
+        usa_dir = data_dir / "usa"
+        eu_dir.mkdir()
+        usa_dir.mkdir()
+        
+        # Write pre-serialized region and regulation files
+        (data_dir / "regions.json").write_bytes(_REGIONS_JSON)
+        (eu_dir / "gdpr.json").write_bytes(_GDPR_JSON)
+        (usa_dir / "hipaa.json").write_bytes(_HIPAA_JSON)
+        
+        yield data_dir
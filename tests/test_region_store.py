@@ -1,76 +1,11 @@
 """Tests for RegionStore class."""
 
-import json
-import tempfile
-from pathlib import Path
-
-import pytest
+import orjson
 
 from server.region_store import RegionStore
 from server.regulation_store import RegulationStore
 
 
-@pytest.fixture
-def temp_data_dir():
-    """Create a temporary directory with sample region and regulation data."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        data_dir = Path(tmpdir)
-        
-        # Create subdirectories
-        eu_dir = data_dir / "eu"
-        usa_dir = data_dir / "usa"
-        eu_dir.mkdir()
-        usa_dir.mkdir()
-        
-        # Create regions.json
-        regions_data = [
-            {
-                "id": "eu",
-                "name": "European Union",
-                "regulations": ["gdpr"],
-                "notes": "EU regulations"
-            },
-            {
-                "id": "usa",
-                "name": "United States of America",
-                "regulations": ["hipaa"],
-                "notes": "US regulations"
-            }
-        ]
-        
-        with open(data_dir / "regions.json", "w", encoding="utf-8") as f:
-            json.dump(regions_data, f)
-        
-        # Create sample regulation files
-        gdpr_data = {
-            "id": "gdpr",
-            "name": "General Data Protection Regulation",
-            "region": "EU",
-            "risk_category": "high",
-            "summary": "GDPR regulation",
-            "articles": [],
-            "developer_guidance": []
-        }
-        
-        hipaa_data = {
-            "id": "hipaa",
-            "name": "Health Insurance Portability and Accountability Act",
-            "region": "USA",
-            "risk_category": "high",
-            "summary": "HIPAA regulation",
-            "articles": [],
-            "developer_guidance": []
-        }
-        
-        with open(eu_dir / "gdpr.json", "w", encoding="utf-8") as f:
-            json.dump(gdpr_data, f)
-        
-        with open(usa_dir / "hipaa.json", "w", encoding="utf-8") as f:
-            json.dump(hipaa_data, f)
-        
-        yield data_dir
-
-
 def test_region_store_loads_regions(temp_data_dir):
     """Test that RegionStore loads regions.json."""
     regulation_store = RegulationStore(str(temp_data_dir))
@@ -107,6 +42,17 @@ def test_get_region_case_insensitive(temp_data_dir):
     assert region1 is not None
 
 
+def test_get_region_returns_cached_result(temp_data_dir):
+    """Test that repeated lookups reuse the aggregated region."""
+    regulation_store = RegulationStore(str(temp_data_dir))
+    region_store = RegionStore(str(temp_data_dir), regulation_store)
+    
+    region1 = region_store.get_region("eu", regulation_store)
+    region2 = region_store.get_region("EU", regulation_store)
+    
+    assert region1 is region2
+
+
 def test_get_region_invalid_id(temp_data_dir):
     """Test getting a region with an invalid ID."""
     regulation_store = RegulationStore(str(temp_data_dir))
@@ -136,3 +82,37 @@ def test_get_region_without_regulation_store(temp_data_dir):
     assert region["id"] == "eu"
     assert region["regulations"] == []
 
+
+def test_get_region_falls_back_to_region_subdirectory(tmp_path):
+    """Test that get_region loads regulations the RegulationStore skipped from the region directory."""
+    (tmp_path / "eu").mkdir()
+    
+    (tmp_path / "regions.json").write_bytes(
+        orjson.dumps([{"id": "eu", "name": "European Union", "regulations": ["legacy"]}])
+    )
+    
+    # No "id" field, so RegulationStore does not index this file
+    (tmp_path / "eu" / "legacy.json").write_bytes(orjson.dumps({"name": "Legacy Regulation"}))
+    
+    regulation_store = RegulationStore(str(tmp_path))
+    region_store = RegionStore(str(tmp_path), regulation_store)
+    
+    region = region_store.get_region("eu", regulation_store)
+    assert region is not None
+    assert region["regulations"] == [{"name": "Legacy Regulation"}]
+
+
+def test_get_region_fallback_matches_file_names_case_insensitively(tmp_path):
+    """Test that the region subdirectory fallback ignores the case of IDs and file names."""
+    (tmp_path / "eu").mkdir()
+    (tmp_path / "regions.json").write_bytes(
+        orjson.dumps([{"id": "eu", "name": "European Union", "regulations": ["Legacy"]}])
+    )
+    (tmp_path / "eu" / "LEGACY.json").write_bytes(orjson.dumps({"name": "Legacy Regulation"}))
+    
+    regulation_store = RegulationStore(str(tmp_path))
+    region_store = RegionStore(str(tmp_path), regulation_store)
+    
+    region = region_store.get_region("eu", regulation_store)
+    assert region is not None
+    assert region["regulations"] == [{"name": "Legacy Regulation"}]
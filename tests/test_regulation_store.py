@@ -1,167 +1,253 @@
 """Tests for RegulationStore class."""
 
-import json
-import tempfile
-from pathlib import Path
+import os
 
+import orjson
 import pytest
 
-from server.regulation_store import RegulationStore
-
-
-@pytest.fixture
-def temp_data_dir():
-    """Create a temporary directory with sample regulation data."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        data_dir = Path(tmpdir)
-        
-        # Create subdirectories
-        eu_dir = data_dir / "eu"
-        usa_dir = data_dir / "usa"
-        eu_dir.mkdir()
-        usa_dir.mkdir()
-        
-        # Create sample regulation files
-        gdpr_data = {
-            "id": "gdpr",
-            "name": "General Data Protection Regulation",
-            "region": "EU",
-            "risk_category": "high",
-            "summary": "GDPR is a data protection regulation",
-            "articles": [
-                {
-                    "article": "32",
-                    "title": "Security of Processing",
-                    "summary": "Implement appropriate security measures",
-                    "notes": "Important security requirement"
-                }
-            ],
-            "developer_guidance": [
-                "Encrypt sensitive data",
-                "Implement access controls"
-            ]
-        }
-        
-        hipaa_data = {
-            "id": "hipaa",
-            "name": "Health Insurance Portability and Accountability Act",
-            "region": "USA",
-            "risk_category": "high",
-            "summary": "HIPAA protects health information",
-            "articles": [
-                {
-                    "article": "164.312",
-                    "title": "Technical safeguards",
-                    "summary": "Implement technical security measures",
-                    "notes": "Technical requirements"
-                }
-            ],
-            "developer_guidance": [
-                "Encrypt PHI",
-                "Implement audit logging"
-            ]
-        }
-        
-        # Write JSON files
-        with open(eu_dir / "gdpr.json", "w", encoding="utf-8") as f:
-            json.dump(gdpr_data, f)
-        
-        with open(usa_dir / "hipaa.json", "w", encoding="utf-8") as f:
-            json.dump(hipaa_data, f)
-        
-        yield data_dir
-
-
-def test_regulation_store_loads_files(temp_data_dir):
+from server import regulation_store
+from server.regulation_store import RegulationStore, write_regulation_bundle
+
+
+@pytest.fixture(scope="session")
+def store(temp_data_dir):
+    """Create a RegulationStore over the shared sample data, once per session."""
+    return RegulationStore(str(temp_data_dir))
+
+
+def write_regulation(directory, reg_id="gdpr", name="General Data Protection Regulation"):
+    """Write a minimal regulation file into a directory, creating it if needed."""
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{reg_id}.json"
+    path.write_bytes(orjson.dumps({"id": reg_id, "name": name}))
+    return path
+
+
+def test_regulation_store_loads_files(store):
     """Test that RegulationStore loads all regulation files."""
-    store = RegulationStore(str(temp_data_dir))
-    
     assert len(store.regulations) == 2
     assert "gdpr" in store.regulations
     assert "hipaa" in store.regulations
 
 
-def test_get_regulation_valid_id(temp_data_dir):
+def test_get_regulation_valid_id(store):
     """Test getting a regulation with a valid ID."""
-    store = RegulationStore(str(temp_data_dir))
-    
     regulation = store.get_regulation("gdpr")
     assert regulation is not None
     assert regulation["id"] == "gdpr"
     assert regulation["name"] == "General Data Protection Regulation"
 
 
-def test_get_regulation_case_insensitive(temp_data_dir):
+def test_get_regulation_case_insensitive(store):
     """Test that get_regulation is case-insensitive."""
-    store = RegulationStore(str(temp_data_dir))
-    
     regulation1 = store.get_regulation("GDPR")
     regulation2 = store.get_regulation("gdpr")
     regulation3 = store.get_regulation("GdPr")
     
-    assert regulation1 == regulation2 == regulation3
-    assert regulation1 is not None
+    # Lookups return the stored dictionary itself, not a copy
+    assert regulation1 is regulation2 is regulation3 is not None
 
 
-def test_get_regulation_invalid_id(temp_data_dir):
+def test_get_regulation_invalid_id(store):
     """Test getting a regulation with an invalid ID."""
-    store = RegulationStore(str(temp_data_dir))
-    
     regulation = store.get_regulation("nonexistent")
     assert regulation is None
 
 
-def test_search_regulations_by_name(temp_data_dir):
+def test_search_regulations_by_name(store):
     """Test searching regulations by name."""
-    store = RegulationStore(str(temp_data_dir))
-    
     results = store.search_regulations("GDPR")
     assert len(results) > 0
     assert any(r["id"] == "gdpr" for r in results)
 
 
-def test_search_regulations_by_summary(temp_data_dir):
+def test_search_regulations_by_summary(store):
     """Test searching regulations by summary."""
-    store = RegulationStore(str(temp_data_dir))
-    
     results = store.search_regulations("data protection")
     assert len(results) > 0
     assert any(r["id"] == "gdpr" for r in results)
 
 
-def test_search_regulations_by_article_title(temp_data_dir):
+def test_search_regulations_by_article_title(store):
     """Test searching regulations by article title."""
-    store = RegulationStore(str(temp_data_dir))
-    
     results = store.search_regulations("Security of Processing")
     assert len(results) > 0
     assert any(r["id"] == "gdpr" for r in results)
 
 
-def test_search_regulations_by_developer_guidance(temp_data_dir):
+def test_search_regulations_by_developer_guidance(store):
     """Test searching regulations by developer guidance."""
-    store = RegulationStore(str(temp_data_dir))
-    
     results = store.search_regulations("Encrypt")
     assert len(results) > 0
     # Both GDPR and HIPAA should match
     assert len(results) >= 1
 
 
-def test_search_regulations_no_results(temp_data_dir):
+def test_search_regulations_partial_word(store):
+    """Test that keywords match inside longer indexed words."""
+    results = store.search_regulations("safeguard")
+    assert [r["id"] for r in results] == ["hipaa"]
+    assert results[0]["match_type"] == "article_title"
+
+
+def test_search_regulations_phrase_across_words(store):
+    """Test that a phrase matches even when it starts and ends mid-word."""
+    results = store.search_regulations("on regul")
+    assert [r["id"] for r in results] == ["gdpr"]
+    assert results[0]["match_type"] == "name"
+
+
+def test_search_regulations_terms_in_different_regulations(store):
+    """Test that a phrase whose words only occur in different regulations doesn't match."""
+    results = store.search_regulations("gdpr safeguards")
+    assert len(results) == 0
+
+
+def test_search_regulations_no_results(store):
     """Test searching with keywords that don't match anything."""
-    store = RegulationStore(str(temp_data_dir))
-    
     results = store.search_regulations("nonexistent keyword xyz")
     assert len(results) == 0
 
 
-def test_search_regulations_ranking(temp_data_dir):
+def test_search_regulations_ranking(store):
     """Test that search results are ranked appropriately."""
-    store = RegulationStore(str(temp_data_dir))
-    
     results = store.search_regulations("GDPR")
     # Name matches should be ranked first
     if results:
         assert results[0]["match_type"] in ["name", "summary", "article_title", "article_summary", "developer_guidance"]
 
+
+def test_search_regulations_snippet_with_leading_whitespace(tmp_path):
+    """Test that snippets stay aligned with the match when a field has leading whitespace."""
+    regulation = {
+        "id": "padded",
+        "name": "Padded Regulation",
+        "summary": "   " + "x" * 150 + " retention period " + "y" * 150,
+        "articles": [],
+        "developer_guidance": []
+    }
+    (tmp_path / "padded.json").write_bytes(orjson.dumps(regulation))
+    
+    store = RegulationStore(str(tmp_path))
+    
+    results = store.search_regulations("retention period")
+    summary = regulation["summary"]
+    idx = summary.index("retention period")
+    expected = "..." + summary[idx - 100:idx + len("retention period") + 100] + "..."
+    assert len(results) == 1
+    assert results[0]["match_type"] == "summary"
+    assert results[0]["snippet"] == expected
+
+
+def test_regulation_store_loads_bundle(tmp_path, monkeypatch):
+    """Test that RegulationStore loads regulations from the bundle when present."""
+    write_regulation(tmp_path / "eu")
+    bundle_path = write_regulation_bundle(tmp_path)
+    
+    loaded = []
+    load_json_file = regulation_store.load_json_file
+    
+    def record_load(file_path):
+        loaded.append(file_path)
+        return load_json_file(file_path)
+    
+    monkeypatch.setattr(regulation_store, "load_json_file", record_load)
+    store = RegulationStore(str(tmp_path))
+    
+    assert loaded == [bundle_path]
+    assert list(store.regulations) == ["gdpr"]
+    assert store.get_regulation("gdpr")["name"] == "General Data Protection Regulation"
+
+
+@pytest.mark.parametrize("subdir", ["eu", "eu/sub", "usa"])
+def test_regulation_store_skips_bundle_missing_new_file(tmp_path, subdir):
+    """Test that a regulation added after the bundle was written is loaded."""
+    write_regulation(tmp_path / "eu")
+    bundle_path = write_regulation_bundle(tmp_path)
+    
+    # Added in the same modification time tick as the bundle, so no directory looks newer
+    dora_path = write_regulation(tmp_path / subdir, "dora", "Digital Operational Resilience Act")
+    bundle_mtime = bundle_path.stat().st_mtime_ns
+    for path in [dora_path, *(p for p in tmp_path.rglob("*") if p.is_dir())]:
+        os.utime(path, ns=(bundle_mtime, bundle_mtime))
+    
+    store = RegulationStore(str(tmp_path))
+    
+    assert sorted(store.regulations) == ["dora", "gdpr"]
+
+
+def test_regulation_store_skips_bundle_after_in_place_edit(tmp_path):
+    """Test that a regulation edited after the bundle was written is loaded from its file."""
+    gdpr_path = write_regulation(tmp_path / "eu")
+    write_regulation_bundle(tmp_path)
+    
+    # An edit that keeps the original modification time is still caught by the size
+    gdpr_mtime = gdpr_path.stat().st_mtime_ns
+    write_regulation(tmp_path / "eu", name="Edited after bundling")
+    os.utime(gdpr_path, ns=(gdpr_mtime, gdpr_mtime))
+    
+    store = RegulationStore(str(tmp_path))
+    
+    assert store.get_regulation("gdpr")["name"] == "Edited after bundling"
+
+
+def test_regulation_store_skips_bundle_after_file_removal(tmp_path):
+    """Test that a regulation removed after the bundle was written is not served."""
+    write_regulation(tmp_path / "eu")
+    dora_path = write_regulation(tmp_path / "eu", "dora", "Digital Operational Resilience Act")
+    write_regulation_bundle(tmp_path)
+    
+    dora_path.unlink()
+    
+    store = RegulationStore(str(tmp_path))
+    
+    assert list(store.regulations) == ["gdpr"]
+
+
+def test_write_regulation_bundle_skips_invalid_file(tmp_path, capsys):
+    """Test that the bundle holds the same regulations as a directory scan when a file is invalid."""
+    write_regulation(tmp_path / "eu")
+    (tmp_path / "eu" / "broken.json").write_bytes(b"{not json")
+    write_regulation_bundle(tmp_path)
+    
+    assert "Skipping invalid regulation file" in capsys.readouterr().err
+    
+    store = RegulationStore(str(tmp_path))
+    
+    # Served from the bundle: no stale-bundle or skipped-file warnings
+    assert list(store.regulations) == ["gdpr"]
+    assert capsys.readouterr().err == ""
+
+
+@pytest.mark.parametrize(
+    "bundle",
+    [
+        [1],
+        {"gdpr": {"id": "gdpr", "name": "Bundle without a file manifest"}},
+        {"files": {}, "regulations": {"x": 5}},
+        {"files": {}, "regulations": {"x": {"name": "No ID"}}},
+    ],
+)
+def test_regulation_store_ignores_malformed_bundle(tmp_path, capsys, bundle):
+    """Test that a bundle with the wrong shape is ignored in favour of the regulation files."""
+    write_regulation(tmp_path / "eu")
+    (tmp_path / "regulations.bundle.json").write_bytes(orjson.dumps(bundle))
+    
+    store = RegulationStore(str(tmp_path))
+    
+    assert list(store.regulations) == ["gdpr"]
+    assert store.search_regulations("data protection")[0]["id"] == "gdpr"
+    # stdout carries the MCP stdio protocol, so warnings must go to stderr
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "Ignoring invalid regulation bundle" in captured.err
+
+
+def test_regulation_store_loads_memory_mapped_file(tmp_path, monkeypatch):
+    """Test that files at or above the mmap threshold load through the memory-mapped path."""
+    monkeypatch.setattr("server.utils.MMAP_THRESHOLD", 0)
+    write_regulation(tmp_path)
+    
+    store = RegulationStore(str(tmp_path))
+    
+    assert store.get_regulation("gdpr")["name"] == "General Data Protection Regulation"